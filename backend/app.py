@@ -1,19 +1,122 @@
-from flask import Flask, jsonify, request
+from flask import Flask, Response, jsonify, request
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import List, Optional
+import hashlib
 import os
+import threading
 from dotenv import load_dotenv
-from llm_services import LLMFactory
+from llm_services import LLMCache, LLMFactory, TTSCache
+
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib parser/encoder
+    orjson = None
+    import json
 
 # Load environment variables
 load_dotenv()
 
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson, so every jsonify() call uses the fast encoder"""
+    
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
+if orjson is not None:
+    app.json = OrjsonProvider(app)
+app.json.compact = True
+app.url_map.strict_slashes = False
 CORS(app)
 
+# Location of the bundled texts
+SAMPLE_TEXTS_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'sample-texts'))
+
+# Voices supported by the OpenAI TTS API
+_VALID_VOICES = frozenset({'alloy', 'echo', 'fable', 'onyx', 'nova', 'shimmer'})
+_VALID_VOICES_MSG = 'Invalid voice. Must be one of: ' + ', '.join(sorted(_VALID_VOICES))
+
+
+def _load_json_file(path: str):
+    """Parse a JSON file, using orjson when it is installed"""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _dump_json_bytes(obj, sort_keys: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS if sort_keys else None)
+    return json.dumps(obj, ensure_ascii=False, sort_keys=sort_keys).encode('utf-8')
+
+
+def _content_hash(obj, prefix: str = '') -> str:
+    """Stable digest of a JSON-serializable object, used for cache keys and ETags"""
+    digest = hashlib.blake2b(prefix.encode('utf-8'), digest_size=16)
+    digest.update(_dump_json_bytes(obj, sort_keys=True))
+    return digest.hexdigest()
+
+
+def _json_response(obj) -> Response:
+    """Serialize a response body directly with orjson, bypassing jsonify"""
+    return Response(_dump_json_bytes(obj), mimetype='application/json')
+
+
+def _provider_dict(provider_info):
+    """JSON-ready form of an optional ProviderInfo"""
+    return provider_info.to_dict() if provider_info is not None else None
+
+
+def _probe_providers():
+    """
+    Instantiate every provider concurrently.
+    Returns the status of each provider and the services that started successfully.
+    """
+    provider_models = LLMFactory.get_provider_models()
+    provider_status = {}
+    services = {}
+    
+    with ThreadPoolExecutor(max_workers=len(provider_models)) as executor:
+        futures = {name: executor.submit(LLMFactory.create_service, name) for name in provider_models}
+        for provider_name, future in futures.items():
+            model = provider_models[provider_name]
+            try:
+                service = future.result()
+            except Exception as e:
+                print(f"❌ {provider_name} not available: {e}")
+                provider_status[provider_name] = {
+                    'available': False,
+                    'model': model,
+                    'error': str(e)
+                }
+                continue
+            
+            services[provider_name] = service
+            provider_status[provider_name] = {
+                'available': True,
+                'model': model,
+                'info': service.get_provider_info().to_dict()
+            }
+    
+    return provider_status, services
+
 
 # Initialize LLM service with smart provider detection
 print("🔍 Detecting available LLM providers...")
-available_providers = LLMFactory.detect_available_providers()
+# Provider availability only changes with the .env configuration, so it is probed once
+_PROVIDER_STATUS_CACHE, _startup_services = _probe_providers()
+available_providers = list(_startup_services)
 print(f"📡 Available providers: {available_providers}")
 
 preferred_provider = LLMFactory.get_preferred_provider(available_providers)
@@ -24,69 +127,101 @@ llm_service = None
 current_provider = None
 
 if preferred_provider:
-    try:
-        llm_service = LLMFactory.create_service(preferred_provider)
-        current_provider = llm_service.get_provider_info()
-        print(f"✅ LLM service initialized with {preferred_provider}: {current_provider}")
-    except Exception as e:
-        print(f"⚠️ LLM service initialization failed: {e}")
-        llm_service = None
-        current_provider = None
+    llm_service = _startup_services[preferred_provider]
+    current_provider = llm_service.get_provider_info()
+    print(f"✅ LLM service initialized with {preferred_provider}: {current_provider}")
 else:
     print("❌ No LLM providers available - check your API keys in .env file")
 
+# Exact-match cache for deterministic LLM responses (page translations, dictionary entries)
+llm_cache = LLMCache()
+
+# Speech is served as MP3 by default, which every browser plays; TTS_FORMAT=opus serves
+# Ogg Opus (about a third the size) when all target browsers support it
+TTS_FORMAT = os.getenv('TTS_FORMAT', 'mp3')
+_TTS_MIMETYPES = {'opus': 'audio/ogg', 'mp3': 'audio/mpeg', 'aac': 'audio/aac', 'flac': 'audio/flac'}
+_TTS_EXTENSIONS = {'opus': 'ogg', 'mp3': 'mp3', 'aac': 'aac', 'flac': 'flac'}
+
+# Generated speech is cached on disk so repeated sentences skip the TTS API
+tts_cache = TTSCache(
+    os.getenv('TTS_CACHE_DIR', os.path.join(os.path.dirname(__file__), 'tts_cache')),
+    max_bytes=int(os.getenv('TTS_CACHE_MAX_MB', '200')) * 1024 * 1024,
+    extension=_TTS_EXTENSIONS[TTS_FORMAT]
+)
+
+@dataclass(slots=True)
+class LoadedText:
+    """A text loaded from its folder: metadata plus rendered and structured pages"""
+    metadata: dict
+    pages: List[str]
+    total_pages: int
+    etag: str  # digest of the metadata
+    raw_pages: List[dict]  # structured page data, aligned with pages
+    page_etags: List[str]  # digest of each page (including the metadata), aligned with pages
+    
+    def get_raw_page(self, page_number: int) -> Optional[dict]:
+        """Structured data for a 0-indexed page, or None if out of range"""
+        if 0 <= page_number < len(self.raw_pages):
+            return self.raw_pages[page_number]
+        return None
+
+
 class TextManager:
     def __init__(self):
         self.texts = {}
         self.load_sample_texts()
+        # Texts are immutable after startup, so the /api/texts payload is built once
+        self._text_list_cache = self._build_text_list()
+        self._text_list_json = _dump_json_bytes(self._text_list_cache)
 
     def load_sample_texts(self):
         """Load sample German texts from folder structure"""
-        sample_texts_dir = os.path.join(os.path.dirname(__file__), '..', 'sample-texts')
-        if os.path.exists(sample_texts_dir):
-            for item in os.listdir(sample_texts_dir):
-                item_path = os.path.join(sample_texts_dir, item)
-                
-                # Handle folder-based structure with metadata
-                if os.path.isdir(item_path):
-                    metadata_file = os.path.join(item_path, 'metadata.json')
-                    if os.path.exists(metadata_file):
-                        self.texts[item] = self._load_folder_based_text(item_path)
-                    else:
-                        print(f"⚠️  Warning: Skipping folder '{item}' - missing metadata.json")
-
-    def _load_folder_based_text(self, folder_path: str) -> dict:
+        try:
+            entries = os.scandir(SAMPLE_TEXTS_DIR)
+        except FileNotFoundError:
+            return
+        
+        with entries:
+            for entry in entries:
+                # Handle folder-based structure with metadata (d_type from readdir, no extra stat)
+                if not entry.is_dir():
+                    continue
+                try:
+                    self.texts[entry.name] = self._load_folder_based_text(entry.path)
+                except FileNotFoundError:
+                    print(f"⚠️  Warning: Skipping folder '{entry.name}' - missing metadata.json")
+
+    def _load_folder_based_text(self, folder_path: str) -> LoadedText:
         """Load text from folder structure with metadata and page files"""
-        import json
-        
-        # Load metadata
-        metadata_file = os.path.join(folder_path, 'metadata.json')
-        with open(metadata_file, 'r', encoding='utf-8') as f:
-            metadata = json.load(f)
+        # Load metadata (raises FileNotFoundError if the folder has none)
+        metadata = _load_json_file(os.path.join(folder_path, 'metadata.json'))
+        metadata_hash = _content_hash(metadata)
         
         # Load pages
-        pages = {}
-        for filename in os.listdir(folder_path):
-            if filename.startswith('page-') and filename.endswith('.json'):
-                page_path = os.path.join(folder_path, filename)
-                with open(page_path, 'r', encoding='utf-8') as f:
-                    page_data = json.load(f)
-                    # Convert page data to displayable text
-                    page_text = self._convert_page_data_to_text(page_data, metadata)
-                    page_number = page_data.get('page_number', 1)
-                    pages[page_number - 1] = page_text  # 0-indexed for frontend
-        
-        # Convert to list format expected by frontend
-        page_list = []
-        for i in range(len(pages)):
-            if i in pages:
-                page_list.append(pages[i])
-        
-        return {
-            'metadata': metadata,
-            'pages': page_list,
-            'total_pages': metadata.get('total_pages', len(page_list))
-        }
+        numbered_pages = []
+        with os.scandir(folder_path) as entries:
+            for entry in entries:
+                if not (entry.name.startswith('page-') and entry.name.endswith('.json')):
+                    continue
+                page_data = _load_json_file(entry.path)
+                page_etag = _content_hash(page_data, prefix=metadata_hash)
+                # Convert page data to displayable text
+                page_text = self._convert_page_data_to_text(page_data, metadata)
+                page_number = page_data.get('page_number', 1)
+                numbered_pages.append((page_number, page_text, page_data, page_etag))
+        
+        # Convert to list format expected by frontend (0-indexed, ordered by page number)
+        numbered_pages.sort(key=lambda page: page[0])
+        page_list = [page_text for _, page_text, _, _ in numbered_pages]
+        
+        return LoadedText(
+            metadata=metadata,
+            pages=page_list,
+            total_pages=metadata.get('total_pages', len(page_list)),
+            etag=metadata_hash,
+            raw_pages=[page_data for _, _, page_data, _ in numbered_pages],
+            page_etags=[page_etag for _, _, _, page_etag in numbered_pages]
+        )
 
     def _convert_page_data_to_text(self, page_data: dict, metadata: dict) -> str:
         """Convert structured page data to display text"""
@@ -112,7 +247,7 @@ class TextManager:
         # Add paragraphs
         for paragraph in page_data.get('paragraphs', []):
             # Combine sentences in paragraph
-            paragraph_text = ' '.join([sentence['text'] for sentence in paragraph.get('sentences', [])])
+            paragraph_text = ' '.join(sentence['text'] for sentence in paragraph.get('sentences', []))
             text_parts.append(paragraph_text)
             text_parts.append('')  # Empty line between paragraphs
         
@@ -120,71 +255,42 @@ class TextManager:
 
     def get_text_page(self, text_name: str, page_number: int):
         """Get a specific page of a text"""
-        if text_name not in self.texts:
+        text_data = self.texts.get(text_name)
+        if text_data is None:
             return None
         
-        text_data = self.texts[text_name]
-        
-        # Handle folder-based format with structured data
-        if isinstance(text_data, dict) and 'pages' in text_data:
-            pages = text_data['pages']
-            metadata = text_data.get('metadata', {})
-            if page_number < 0 or page_number >= len(pages):
-                return None
-            
-            # Load structured page data as well
-            structured_page_data = None
-            try:
-                import os
-                import json
-                sample_texts_dir = os.path.join(os.path.dirname(__file__), '..', 'sample-texts')
-                page_file = os.path.join(sample_texts_dir, text_name, f'page-{page_number + 1:03d}.json')
-                
-                if os.path.exists(page_file):
-                    with open(page_file, 'r', encoding='utf-8') as f:
-                        structured_page_data = json.load(f)
-            except Exception as e:
-                print(f"Warning: Could not load structured page data: {e}")
-            
-            response = {
-                'current_page': page_number,
-                'total_pages': len(pages),
-                'text_name': text_name,
-                'metadata': metadata
-            }
-            
-            # Include structured page data (required)
-            if structured_page_data:
-                response['page_data'] = structured_page_data
-            else:
-                # If no structured data available, return error
-                return None
-                
-            return response
+        # Structured page data (parsed at startup) is required
+        structured_page_data = text_data.get_raw_page(page_number)
+        if structured_page_data is None:
+            return None
         
-        # Only structured format supported
-        print(f"⚠️  Warning: Text '{text_name}' does not have the expected structure")
-        return None
+        return {
+            'current_page': page_number,
+            'total_pages': len(text_data.pages),
+            'text_name': text_name,
+            'metadata': text_data.metadata,
+            'page_data': structured_page_data
+        }
     
     def get_text_list(self):
         """Get list of available texts with metadata"""
+        return self._text_list_cache
+
+    def _build_text_list(self):
+        """Build the list of available texts with metadata"""
         text_list = []
         for text_name, text_data in self.texts.items():
-            # Expect structured format with metadata
-            if not (isinstance(text_data, dict) and 'metadata' in text_data):
-                print(f"⚠️  Warning: Skipping text '{text_name}' - missing metadata structure")
-                continue
-                
-            metadata = text_data['metadata']
+            metadata = text_data.metadata
             text_list.append({
                 'name': text_name,
                 'title': metadata.get('title', text_name),
                 'author': metadata.get('author', 'Unknown'),
                 'year': metadata.get('year'),
                 'genre': metadata.get('genre'),
-                'total_pages': text_data.get('total_pages', len(text_data.get('pages', []))),
+                'total_pages': text_data.total_pages,
                 'difficulty': metadata.get('difficulty'),
-                'estimated_reading_time': metadata.get('estimated_reading_time')
+                'estimated_reading_time': metadata.get('estimated_reading_time'),
+                'metadata_hash': text_data.etag
             })
         return text_list
 
@@ -193,7 +299,7 @@ text_manager = TextManager()
 @app.route('/api/texts', methods=['GET'])
 def get_texts():
     """Get list of available texts"""
-    return jsonify(text_manager.get_text_list())
+    return Response(text_manager._text_list_json, mimetype='application/json')
 
 @app.route('/api/text/<text_name>/page/<int:page_number>', methods=['GET'])
 def get_text_page(text_name, page_number):
@@ -201,7 +307,74 @@ def get_text_page(text_name, page_number):
     result = text_manager.get_text_page(text_name, page_number)
     if result is None:
         return jsonify({'error': 'Text or page not found'}), 404
-    return jsonify(result)
+    
+    # Pages never change after startup, so browsers can revalidate with If-None-Match
+    etag = text_manager.texts[text_name].page_etags[page_number]
+    if request.if_none_match.contains(etag):
+        response = Response(status=304)
+    else:
+        response = _json_response(result)
+    response.set_etag(etag)
+    return response
+
+# Upper bound on pages per /api/translate-pages request
+MAX_BATCH_PAGES = 10
+
+# Background translation of the page after the one just translated, hidden behind reading time
+PREFETCH_NEXT_PAGE = os.getenv('PREFETCH_NEXT_PAGE', 'true').lower() == 'true'
+_prefetch_pool = ThreadPoolExecutor(max_workers=4)
+
+# One lock per translation cache key, so concurrent requests for a page share a single LLM call
+_translation_locks = {}
+_translation_locks_guard = threading.Lock()
+
+
+def _translation_lock(cache_key: str) -> threading.Lock:
+    with _translation_locks_guard:
+        return _translation_locks.setdefault(cache_key, threading.Lock())
+
+
+def _translate_page_cached(text_name: str, page_number: int, text_data: LoadedText, page_data: dict) -> dict:
+    """Translate a structured page, reusing an earlier translation of the same content"""
+    cache_key = LLMCache.make_key(
+        'translate',
+        provider=current_provider.provider,
+        model=current_provider.model,
+        text=text_name,
+        page=page_number,
+        page_etag=text_data.page_etags[page_number]
+    )
+    result = llm_cache.get(cache_key)
+    if result is None:
+        with _translation_lock(cache_key):
+            # Another request may have translated the page while we waited
+            result = llm_cache.get(cache_key)
+            if result is None:
+                # Create translation request for LLM; the shared metadata block goes first
+                translation_request = {
+                    'metadata': text_data.metadata,
+                    'page_data': page_data
+                }
+                
+                # Send translation request directly to LLM; page_data is the shared parsed
+                # page, so it must not be translated in place
+                result = llm_service.translate(translation_request)
+                llm_cache.set(cache_key, result)
+    
+    # LLM service already returns standardized format
+    return result
+
+
+def _warm_translation(text_name: str, page_number: int):
+    """Translate a page in the background so it is already cached when the reader gets there"""
+    try:
+        text_data = text_manager.texts.get(text_name)
+        page_data = text_data.get_raw_page(page_number) if text_data is not None else None
+        if page_data is None:
+            return
+        _translate_page_cached(text_name, page_number, text_data, page_data)
+    except Exception as e:
+        print(f"⚠️  Warning: Prefetching translation of '{text_name}' page {page_number} failed: {e}")
 
 @app.route('/api/translate-page', methods=['POST'])
 def translate_page():
@@ -219,32 +392,65 @@ def translate_page():
     try:
         # Get the structured page data
         text_data = text_manager.texts.get(text_name)
-        if not text_data or not isinstance(text_data, dict) or 'metadata' not in text_data:
+        if text_data is None:
             return jsonify({'error': 'Structured text not found'}), 404
         
-        # Load the specific page JSON file
-        import os
-        import json
-        sample_texts_dir = os.path.join(os.path.dirname(__file__), '..', 'sample-texts')
-        page_file = os.path.join(sample_texts_dir, text_name, f'page-{page_number + 1:03d}.json')
-        
-        if not os.path.exists(page_file):
+        # Structured page data was parsed at startup; no disk access needed
+        page_data = text_data.get_raw_page(page_number)
+        if page_data is None:
             return jsonify({'error': 'Page file not found'}), 404
         
-        with open(page_file, 'r', encoding='utf-8') as f:
-            page_data = json.load(f)
+        result = _translate_page_cached(text_name, page_number, text_data, page_data)
         
-        # Create translation request for LLM
-        translation_request = {
-            'metadata': text_data['metadata'],
-            'page_data': page_data
-        }
+        # The reader is translating page by page; start on the next one while they read this one
+        if PREFETCH_NEXT_PAGE:
+            _prefetch_pool.submit(_warm_translation, text_name, page_number + 1)
         
-        # Send translation request directly to LLM
-        result = llm_service.translate(translation_request)
+        return _json_response(result)
         
-        # LLM service already returns standardized format
-        return jsonify(result)
+    except Exception as e:
+        return jsonify({'error': f'Page translation failed: {str(e)}'}), 500
+
+@app.route('/api/translate-pages', methods=['POST'])
+def translate_pages():
+    """Translate several pages of one text, sharing the text metadata across all of them"""
+    if not llm_service:
+        return jsonify({'error': 'LLM service not available'}), 503
+    
+    data = request.get_json()
+    text_name = data.get('text_name', '')
+    page_numbers = data.get('page_numbers', [])
+    
+    if not text_name:
+        return jsonify({'error': 'No text name provided'}), 400
+    # type() rather than isinstance(): bool is an int subclass and true/false are not page numbers
+    if not isinstance(page_numbers, list) or not page_numbers or not all(type(n) is int for n in page_numbers):
+        return jsonify({'error': 'page_numbers must be a non-empty list of integers'}), 400
+    if len(page_numbers) > MAX_BATCH_PAGES:
+        return jsonify({'error': f'At most {MAX_BATCH_PAGES} pages can be translated per request'}), 400
+    
+    try:
+        text_data = text_manager.texts.get(text_name)
+        if text_data is None:
+            return jsonify({'error': 'Structured text not found'}), 404
+        
+        page_numbers = list(dict.fromkeys(page_numbers))
+        pages = {}
+        for page_number in page_numbers:
+            page_data = text_data.get_raw_page(page_number)
+            if page_data is None:
+                return jsonify({'error': f'Page file not found: {page_number}'}), 404
+            pages[page_number] = page_data
+        
+        # Pages are independent, so translate them concurrently
+        with ThreadPoolExecutor(max_workers=len(pages)) as executor:
+            futures = {
+                page_number: executor.submit(_translate_page_cached, text_name, page_number, text_data, page_data)
+                for page_number, page_data in pages.items()
+            }
+            results = {str(page_number): future.result() for page_number, future in futures.items()}
+        
+        return _json_response(results)
         
     except Exception as e:
         return jsonify({'error': f'Page translation failed: {str(e)}'}), 500
@@ -268,7 +474,7 @@ def chat():
         
         return jsonify({
             'response': response,
-            'provider': provider_info['provider']
+            'provider': provider_info.provider
         })
         
     except Exception as e:
@@ -294,8 +500,8 @@ def get_llm_info():
         current_info = None
         if llm_service and current_provider:
             current_info = {
-                'provider': current_provider['provider'],
-                'description': current_provider['description']
+                'provider': current_provider.provider,
+                'description': current_provider.description
             }
         
         return jsonify({
@@ -323,8 +529,18 @@ def dictionary_lookup():
         if not word:
             return jsonify({'error': 'Word or phrase cannot be empty'}), 400
         
-        # Use LLM service dictionary lookup method
-        response = llm_service.dictionary_lookup(word, context)
+        # Use LLM service dictionary lookup method, reusing earlier lookups of the same word in the same context
+        cache_key = LLMCache.make_key(
+            'dictionary',
+            provider=current_provider.provider,
+            model=current_provider.model,
+            word=word,
+            context=context
+        )
+        response = llm_cache.get(cache_key)
+        if response is None:
+            response = llm_service.dictionary_lookup(word, context)
+            llm_cache.set(cache_key, response)
         
         return jsonify({
             'word': word,
@@ -336,6 +552,18 @@ def dictionary_lookup():
         print(f"Dictionary lookup error: {e}")
         return jsonify({'error': f'Dictionary lookup failed: {str(e)}'}), 500
 
+def _tee_speech_to_cache(cache_key, first_chunk, chunks):
+    """Yield streamed audio chunks and cache the whole clip if the stream completes."""
+    parts = [first_chunk]
+    yield first_chunk
+    for chunk in chunks:
+        parts.append(chunk)
+        yield chunk
+    audio_data = b''.join(parts)
+    # An empty stream would otherwise be cached and served as silence from then on
+    if audio_data:
+        tts_cache.set(cache_key, audio_data)
+
 @app.route('/api/tts/speak', methods=['POST'])
 def text_to_speech():
     """Generate speech audio for a German sentence using GPT-4o mini's TTS capability."""
@@ -354,30 +582,31 @@ def text_to_speech():
         return jsonify({'error': 'Text cannot be empty'}), 400
     
     # Validate voice parameter
-    valid_voices = ['alloy', 'echo', 'fable', 'onyx', 'nova', 'shimmer']
-    if voice not in valid_voices:
-        return jsonify({'error': f'Invalid voice. Must be one of: {", ".join(valid_voices)}'}), 400
+    if voice not in _VALID_VOICES:
+        return jsonify({'error': _VALID_VOICES_MSG}), 400
     
     # Validate speed parameter
     if not (0.25 <= speed <= 4.0):
         return jsonify({'error': 'Speed must be between 0.25 and 4.0'}), 400
     
     try:
-        # Generate audio using LLM service
-        audio_data = llm_service.generate_speech(text, voice=voice, speed=speed)
-        
-        # Return audio as base64 encoded data
-        import base64
-        audio_base64 = base64.b64encode(audio_data).decode('utf-8')
-        
-        return jsonify({
-            'success': True,
-            'audio': audio_base64,
-            'format': 'mp3',
-            'text': text,
-            'voice': voice,
-            'speed': speed
-        })
+        # Reuse previously generated audio, otherwise stream it from the LLM service
+        # while it is synthesized and store the complete clip once the stream ends
+        cache_key = TTSCache.make_key(text, voice, speed)
+        audio_data = tts_cache.get(cache_key)
+        if audio_data is None:
+            chunks = llm_service.generate_speech(text, voice=voice, speed=speed, stream=True,
+                                                 response_format=TTS_FORMAT)
+            # Pull the first chunk here so provider errors still produce a JSON error response
+            first_chunk = next(chunks, b'')
+            audio_data = _tee_speech_to_cache(cache_key, first_chunk, chunks)
+        
+        # Return raw audio bytes; request parameters travel in headers
+        response = Response(audio_data, mimetype=_TTS_MIMETYPES[TTS_FORMAT])
+        response.headers['X-TTS-Voice'] = voice
+        response.headers['X-TTS-Speed'] = str(speed)
+        response.headers['Cache-Control'] = 'public, max-age=86400'
+        return response
         
     except Exception as e:
         print(f"TTS Error: {str(e)}")
@@ -386,34 +615,28 @@ def text_to_speech():
 @app.route('/api/llm/providers', methods=['GET'])
 def get_available_providers():
     """Get list of available LLM providers"""
+    return jsonify({
+        'providers': dict(_PROVIDER_STATUS_CACHE),
+        'current': _provider_dict(current_provider)
+    })
+
+@app.route('/api/llm/providers/refresh', methods=['POST'])
+def refresh_providers():
+    """Re-read .env and rebuild the cached provider status"""
+    global _PROVIDER_STATUS_CACHE
+    
     try:
-        providers = LLMFactory.get_provider_models()
-        
-        # Add status information for each provider
-        provider_status = {}
-        for provider_name in providers.keys():
-            try:
-                # Try to create service to check if it's available
-                test_service = LLMFactory.create_service(provider_name)
-                provider_status[provider_name] = {
-                    'available': True,
-                    'model': providers[provider_name],
-                    'info': test_service.get_provider_info()
-                }
-            except Exception as e:
-                provider_status[provider_name] = {
-                    'available': False,
-                    'model': providers[provider_name],
-                    'error': str(e)
-                }
+        load_dotenv(override=True)
+        LLMFactory.test_provider_availability.cache_clear()
+        _PROVIDER_STATUS_CACHE, _ = _probe_providers()
         
         return jsonify({
-            'providers': provider_status,
-            'current': current_provider
+            'providers': dict(_PROVIDER_STATUS_CACHE),
+            'current': _provider_dict(current_provider)
         })
         
     except Exception as e:
-        print(f"Error getting providers: {e}")
+        print(f"Error refreshing providers: {e}")
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/llm/provider', methods=['POST'])
@@ -445,8 +668,8 @@ def switch_provider():
         
         return jsonify({
             'success': True,
-            'provider': new_provider_info,
-            'message': f"Successfully switched to {new_provider_info['provider']}"
+            'provider': new_provider_info.to_dict(),
+            'message': f"Successfully switched to {new_provider_info.provider}"
         })
         
     except Exception as e:
@@ -462,10 +685,9 @@ def get_current_provider():
     if llm_service is None:
         return jsonify({'error': 'No LLM service available'}), 503
     
-    return jsonify({
-        'provider': current_provider,
-        'available': True
-    })
+    # Body is assembled from the provider's precomputed JSON
+    body = b'{"provider":' + current_provider._json + b',"available":true}'
+    return Response(body, mimetype='application/json')
 
 @app.route('/api/health', methods=['GET'])
 def health_check():
@@ -473,9 +695,10 @@ def health_check():
     return jsonify({
         'status': 'healthy',
         'llm_available': llm_service is not None,
-        'current_provider': current_provider
+        'current_provider': _provider_dict(current_provider)
     })
 
 if __name__ == '__main__':
     debug_mode = os.getenv('FLASK_DEBUG', 'true').lower() == 'true'
-    app.run(debug=debug_mode, port=5001)
\ No newline at end of file
+    # Development server only; production runs through wsgi.py under gunicorn
+    app.run(debug=debug_mode, port=5001, threaded=True)
\ No newline at end of file
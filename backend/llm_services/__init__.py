@@ -21,10 +21,11 @@ Usage:
 """
 
 # Export main classes for easy importing
-from .base import LLMService
+from .base import LLMService, ProviderInfo
 from .factory import LLMFactory
 from .gpt_service import GPTService
 from .gemini_service import GeminiService
+from .cache import LLMCache, TTSCache
 
 # Version information
 __version__ = "1.0.0"
@@ -32,7 +33,10 @@ __version__ = "1.0.0"
 # Public API
 __all__ = [
     "LLMService",
+    "ProviderInfo",
     "LLMFactory", 
     "GPTService",
-    "GeminiService"
+    "GeminiService",
+    "LLMCache",
+    "TTSCache"
 ]
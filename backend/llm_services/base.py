@@ -6,19 +6,180 @@ and provides shared translation logic.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, Any, Iterator, List, Optional, Union
+import asyncio
+import copy
+from functools import lru_cache
 import json
+import os
+import re
+import threading
+from cachetools import LRUCache
+
+
+# Sentences made only of punctuation/whitespace are copied through without an LLM call
+_NON_WORD_RE = re.compile(r'^[\W_]+$')
+
+# Speaker names that have a conventional English form; all others are kept as-is
+_SPEAKER_TRANSLATIONS = {
+    "CHOR": "CHORUS",
+    "ALLE": "ALL",
+    "STIMME": "VOICE",
+    "SPRECHER": "NARRATOR"
+}
+
+# Upper bounds for the sentences packed into a single batched translation request
+BATCH_MAX_SENTENCES = 20
+BATCH_MAX_CHARS = 3000
+
+# JSON shapes requested from providers that support schema-constrained output
+ENGLISH_SENTENCES_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "english_sentences": {"type": "array", "items": {"type": "string"}}
+    },
+    "required": ["english_sentences"]
+}
+BATCH_TRANSLATIONS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "translations": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "id": {"type": "integer"},
+                    "english_sentences": {"type": "array", "items": {"type": "string"}}
+                },
+                "required": ["id", "english_sentences"]
+            }
+        }
+    },
+    "required": ["translations"]
+}
+
+# System prompt for single-sentence translation. Sentence-type specifics come after the long
+# invariant block so the prompt prefix is identical across calls, which lets provider-side
+# prompt caching reuse it
+_SYSTEM_PROMPT_TEMPLATE = (
+    "🚨 CRITICAL: You are translating German literature with paragraph context for better quality. "
+    "TRANSLATE ONLY THE SPECIFIED SENTENCE - do not translate the entire paragraph. "
+    "Use the paragraph context to understand tone, style, and meaning, but return only the translation of the target sentence. "
+    "PRESERVE THE PARAGRAPH STRUCTURE - do not merge with sentences from other paragraphs. "
+    "🚨🚨🚨 ABSOLUTE CRITICAL REQUIREMENT: PRESERVE LINE BREAKS 🚨🚨🚨 "
+    "The German text contains \\n characters that represent poetry line breaks. "
+    "YOU MUST PRESERVE EVERY SINGLE \\n CHARACTER IN THE EXACT SAME POSITION. "
+    "COUNT the \\n characters in the German text and ensure your English has THE SAME NUMBER of \\n characters. "
+    "EXAMPLE: German 'Habe nun, ach! Philosophie,\\nJuristerei und Medizin' MUST become English 'I have now, alas! Philosophy,\\nJurisprudence and Medicine' "
+    "DO NOT REMOVE LINE BREAKS. DO NOT MERGE LINES. PRESERVE \\n EXACTLY. "
+    "You may split ONE German sentence into multiple English sentences for clarity, "
+    "but maintain the literary style and emotional tone. "
+    "Convert German quotation marks (»«) to English style (\"\"). "
+    "The target sentence is {sentence_type} text; maintain appropriate style and formatting conventions for {sentence_type} text. "
+    "Return ONLY valid JSON of the form: "
+    '{{"english_sentences": ["Sentence 1.", "Sentence 2."]}}'
+)
+
+
+@lru_cache(maxsize=8)
+def _system_prompt(sentence_type: str) -> str:
+    """Return the single-sentence system prompt for a sentence type."""
+    return _SYSTEM_PROMPT_TEMPLATE.format(sentence_type=sentence_type)
+
+
+# System prompt for batched translation of several sentences of one paragraph
+_BATCH_SYSTEM_PROMPT = (
+    "🚨 CRITICAL: You are translating German literature with paragraph context for better quality. "
+    "You receive a JSON array of sentences, each with an id, its German text and its sentence type. "
+    "Translate EVERY sentence separately and keep its id - do not merge, drop or reorder sentences. "
+    "Use the paragraph context to understand tone, style, and meaning. "
+    "🚨🚨🚨 ABSOLUTE CRITICAL REQUIREMENT: PRESERVE LINE BREAKS 🚨🚨🚨 "
+    "The German text contains \\n characters that represent poetry line breaks. "
+    "YOU MUST PRESERVE EVERY SINGLE \\n CHARACTER IN THE EXACT SAME POSITION. "
+    "COUNT the \\n characters in each German sentence and ensure its English has THE SAME NUMBER of \\n characters. "
+    "DO NOT REMOVE LINE BREAKS. DO NOT MERGE LINES. PRESERVE \\n EXACTLY. "
+    "You may split ONE German sentence into multiple English sentences for clarity, "
+    "but maintain the literary style and emotional tone appropriate for its sentence type. "
+    "Convert German quotation marks (»«) to English style (\"\"). "
+    "Return ONLY valid JSON of the form: "
+    '{"translations": [{"id": 0, "english_sentences": ["Sentence 1.", "Sentence 2."]}]}'
+)
+
+
+# Process-wide limit on in-flight LLM requests, shared by every page being translated
+# (batch translation and prefetch run several pages at once). Created lazily on the
+# shared event loop, which is the only loop that ever awaits it.
+_llm_semaphore = None
+
+
+def _get_llm_semaphore() -> asyncio.Semaphore:
+    """Return the shared request limiter, sized from LLM_MAX_CONCURRENCY and OPENAI_RPM."""
+    global _llm_semaphore
+    if _llm_semaphore is None:
+        limit = int(os.getenv("LLM_MAX_CONCURRENCY", "8"))
+        # A requests-per-minute quota allows roughly RPM/60 requests in flight at ~1 s each;
+        # OPENAI_RPM applies to whichever provider is active
+        rpm = os.getenv("OPENAI_RPM")
+        if rpm:
+            limit = min(limit, max(1, int(rpm) // 60))
+        _llm_semaphore = asyncio.Semaphore(limit)
+    return _llm_semaphore
+
+
+# Shared event loop for async LLM calls. Async API clients bind their connection pools
+# to the loop they first run on, so every translation runs on this one long-lived loop.
+_event_loop = None
+_event_loop_lock = threading.Lock()
+
+
+def _run_async(coro):
+    """Run a coroutine on the shared background event loop and block until it finishes."""
+    global _event_loop
+    with _event_loop_lock:
+        if _event_loop is None:
+            _event_loop = asyncio.new_event_loop()
+            threading.Thread(target=_event_loop.run_forever, name="llm-event-loop", daemon=True).start()
+    return asyncio.run_coroutine_threadsafe(coro, _event_loop).result()
+
+
+@dataclass(frozen=True, slots=True)
+class ProviderInfo:
+    """Immutable description of an LLM provider, with its JSON encoding precomputed"""
+    provider: str
+    model: str
+    description: str
+    _json: bytes = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        object.__setattr__(self, "_json", json.dumps(self.to_dict(), separators=(",", ":")).encode("utf-8"))
+    
+    def to_dict(self) -> Dict[str, str]:
+        """Plain dict form for JSON responses."""
+        return {
+            "provider": self.provider,
+            "model": self.model,
+            "description": self.description
+        }
 
 
 class LLMService(ABC):
     """Abstract base class for LLM services with shared translation logic"""
     
-    def translate(self, text: Dict[str, Any]) -> Dict[str, Any]:
+    def __init__(self):
+        # Translations that do not depend on paragraph context (stage directions, metadata
+        # fields), kept for the lifetime of the service so repeats across pages are free
+        self._trans_cache = LRUCache(maxsize=4096)
+        self._trans_cache_lock = threading.Lock()
+    
+    def translate(self, text: Dict[str, Any], mutate_in_place: bool = False) -> Dict[str, Any]:
         """
         Translate German book data to English with structure preservation.
         
         Args:
             text: Structured book data dict with 'page_data' and optionally 'metadata'
+            mutate_in_place: Attach translations to the caller's page_data instead of a copy.
+                Only safe when the caller does not keep or share the input dict.
             
         Returns:
             Standardized translation response:
@@ -32,81 +193,190 @@ class LLMService(ABC):
         if isinstance(text, dict) and "page_data" in text:
             # Expected format: {"metadata": {...}, "page_data": {...}} (first page)
             # or: {"page_data": {...}} (subsequent pages)
-            return self._translate_book_data(text)
+            return _run_async(self._a_translate_book_data(text, mutate_in_place))
         else:
             raise ValueError("Expected structured book data with 'page_data' field")
     
-    def _translate_book_data(self, book_data: dict) -> dict:
+    async def _a_translate_book_data(self, book_data: dict, mutate_in_place: bool = False) -> dict:
         """
         Translate book data with new simplified structure.
         Preserves original German structure and attaches English translations directly.
         No complex mapping needed - English is attached as 'english_translation' array.
+        Dialogue and narration sentences are translated in per-paragraph batches; batches and
+        other translations are sent concurrently, at most LLM_MAX_CONCURRENCY at a time across
+        all pages being translated by the process.
         """
+        semaphore = _get_llm_semaphore()
+        
+        async def limited(coro):
+            async with semaphore:
+                return await coro
+        
         # Create response structure preserving original German data
         response = {
-            "page_data": json.loads(json.dumps(book_data["page_data"])),  # deep copy of original structure
+            "page_data": book_data["page_data"] if mutate_in_place else copy.deepcopy(book_data["page_data"]),
             "provider": self.get_provider_name()
         }
 
-        # Translate metadata if it exists (for translation context)
+        # Start translating title and author right away; they run alongside the sentence
+        # translations under the same concurrency limit and are collected at the end
+        metadata_tasks = {}
         if "metadata" in book_data:
-            translated_metadata = {}
-            original_metadata = book_data["metadata"]
-            
-            # Translate specific fields
-            if "title" in original_metadata:
-                translated_metadata["title"] = self._translate_metadata_field(original_metadata["title"])
-            if "author" in original_metadata:
-                translated_metadata["author"] = self._translate_metadata_field(original_metadata["author"])
-            if "description" in original_metadata:
-                translated_metadata["description"] = original_metadata["description"]
-            if "genre" in original_metadata:
-                translated_metadata["genre"] = original_metadata["genre"]
-            
-            response["metadata"] = translated_metadata
+            for field_name in ("title", "author"):
+                if field_name in book_data["metadata"]:
+                    field_text = book_data["metadata"][field_name]
+                    metadata_tasks[field_name] = asyncio.create_task(limited(self._cached_translation(
+                        "metadata", field_text, None,
+                        lambda text=field_text: self._translate_metadata_field(text)
+                    )))
 
         # Extract global metadata context for translation (if available)
         metadata_context = book_data.get("metadata", None)
+        # The BOOK CONTEXT block is identical for every prompt on the page
+        metadata_prefix = self._build_metadata_prefix(metadata_context)
+
+        # Coroutines that each fill in english_translation for one or more sentences
+        pending_calls = []
+        
+        async def translate_one(sentence, coro):
+            sentence["english_translation"] = await limited(coro)
+        
+        async def translate_stage_direction(text):
+            try:
+                return await self._cached_translation(
+                    "stage_direction", text, metadata_context,
+                    lambda: self._translate_stage_direction_sentences(text, metadata_context)
+                )
+            except ValueError:
+                return [text]  # fallback to original text; not cached, so the next page retries
+        
+        async def translate_batch(batch, paragraph_prefix):
+            items = [
+                {"id": i, "text": sentence["text"], "type": sentence.get("type", "narration")}
+                for i, (_, sentence) in enumerate(batch)
+            ]
+            translations = await limited(self._translate_batch(items, paragraph_prefix))
+            
+            # Sentences the model dropped or mangled are retried one at a time
+            retries = []
+            for item, (sent_idx, sentence) in zip(items, batch):
+                eng_sentences = translations.get(item["id"])
+                if eng_sentences is not None:
+                    sentence["english_translation"] = eng_sentences
+                else:
+                    retries.append(translate_one(sentence, self._translate_and_split_with_context(
+                        item["text"], paragraph_prefix, sent_idx, item["type"]
+                    )))
+            await asyncio.gather(*retries)
+        
+        def flush(batch, paragraph_prefix):
+            if len(batch) == 1:
+                sent_idx, sentence = batch[0]
+                pending_calls.append(translate_one(sentence, self._translate_and_split_with_context(
+                    sentence["text"], paragraph_prefix, sent_idx, sentence.get("type", "narration")
+                )))
+            elif batch:
+                pending_calls.append(translate_batch(batch, paragraph_prefix))
 
         # Process each paragraph
         for paragraph in response["page_data"]["paragraphs"]:
             # Extract full paragraph context for better translation
-            paragraph_context = []
-            for sentence in paragraph["sentences"]:
-                paragraph_context.append(sentence["text"])
-            full_paragraph_text = " ".join(paragraph_context)
+            full_paragraph_text = " ".join(sentence["text"] for sentence in paragraph["sentences"])
+            paragraph_prefix = self._build_paragraph_prefix(metadata_prefix, full_paragraph_text)
+            
+            # Dialogue and narration sentences are packed into batches of at most
+            # BATCH_MAX_SENTENCES sentences / BATCH_MAX_CHARS characters per request
+            batch = []
+            batch_chars = 0
             
             # Process each sentence in the paragraph
             for sent_idx, sentence in enumerate(paragraph["sentences"]):
                 german_text = sentence["text"]
                 sentence_type = sentence.get("type", "narration")  # Default to narration
 
+                # Nothing to translate in empty lines or bare punctuation
+                stripped = german_text.strip()
+                if not stripped or _NON_WORD_RE.match(stripped):
+                    sentence["english_translation"] = [german_text]
+                    continue
+
                 # Translate sentence based on its type and create english_translation array
                 if sentence_type == "stage_direction":
-                    eng_sentences = self._translate_stage_direction_sentences(german_text, metadata_context)
+                    pending_calls.append(translate_one(sentence, translate_stage_direction(german_text)))
                 elif sentence_type == "speaker_name":
-                    eng_sentences = self._translate_speaker_name(german_text, metadata_context)
+                    # Same lookup as _translate_speaker_name, inlined; no LLM call needed
+                    sentence["english_translation"] = [_SPEAKER_TRANSLATIONS.get(german_text.upper(), german_text)]
                 else:  # dialogue, narration, or other types
-                    eng_sentences = self._translate_and_split_with_context(
-                        german_text, 
-                        full_paragraph_text, 
-                        sent_idx,
-                        metadata_context,
-                        sentence_type
-                    )
+                    if batch and (len(batch) >= BATCH_MAX_SENTENCES or batch_chars + len(german_text) > BATCH_MAX_CHARS):
+                        flush(batch, paragraph_prefix)
+                        batch, batch_chars = [], 0
+                    batch.append((sent_idx, sentence))
+                    batch_chars += len(german_text)
+            
+            flush(batch, paragraph_prefix)
 
-                # Store English translation - frontend will handle line breaks using German text
-                sentence["english_translation"] = eng_sentences
+        # Store English translations - frontend will handle line breaks using German text
+        await asyncio.gather(*metadata_tasks.values(), *pending_calls)
+
+        # Translate metadata if it exists (for translation context)
+        if "metadata" in book_data:
+            translated_metadata = {}
+            original_metadata = book_data["metadata"]
+            
+            # Title and author translations started above
+            for field_name, task in metadata_tasks.items():
+                translated_metadata[field_name] = task.result()
+            if "description" in original_metadata:
+                translated_metadata["description"] = original_metadata["description"]
+            if "genre" in original_metadata:
+                translated_metadata["genre"] = original_metadata["genre"]
+            
+            response["metadata"] = translated_metadata
 
         return response
     
-    def _translate_metadata_field(self, text: str) -> str:
+    async def _cached_translation(self, sentence_type: str, text: str, metadata: Optional[dict],
+                                  translate: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Return a context-free translation from the instance cache, translating on a miss.
+        
+        Args:
+            sentence_type: Kind of text being translated (part of the cache key)
+            text: German source text
+            metadata: Book metadata; its title and author are part of the cache key
+            translate: Zero-argument coroutine function performing the translation
+            
+        Returns:
+            The cached or freshly computed translation
+        """
+        metadata = metadata or {}
+        key = (sentence_type, text, metadata.get("title"), metadata.get("author"))
+        # The cache holds tasks on the shared event loop, so identical texts translated
+        # concurrently (e.g. repeated stage directions on one page) share a single request
+        with self._trans_cache_lock:
+            task = self._trans_cache.get(key)
+            if task is None:
+                task = asyncio.ensure_future(translate())
+                self._trans_cache[key] = task
+        try:
+            return await asyncio.shield(task)
+        except Exception:
+            # Don't keep failures around; the next request retries
+            with self._trans_cache_lock:
+                if self._trans_cache.get(key) is task:
+                    del self._trans_cache[key]
+            raise
+    
+    async def _translate_metadata_field(self, text: str) -> str:
         """Translate short metadata fields using LLM API."""
         prompt = f"Translate the following from German to English. Return only the translation text: {text}"
-        return self._simple_translate(prompt, max_tokens=200, temperature=0.0)
+        return await self._a_simple_translate(prompt, max_tokens=200, temperature=0.0)
     
-    def _translate_stage_direction_sentences(self, text: str, metadata: dict = None) -> List[str]:
-        """Translate stage direction as sentences, preserving line breaks and formatting."""
+    async def _translate_stage_direction_sentences(self, text: str, metadata: dict = None) -> List[str]:
+        """
+        Translate stage direction as sentences, preserving line breaks and formatting.
+        Raises ValueError on a malformed reply, so the caller's fallback is never cached.
+        """
         system_prompt = (
             "You are translating stage directions from German drama to English. "
             "Preserve all line breaks (\\n) exactly as they appear in the original. "
@@ -119,30 +389,25 @@ class LLMService(ABC):
         if metadata:
             user_prompt = f"From '{metadata.get('title', 'German drama')}' by {metadata.get('author', 'unknown')}: {user_prompt}"
         
-        response = self._json_translate(system_prompt, user_prompt, max_tokens=300, temperature=0.0)
+        response = await self._a_json_translate(system_prompt, user_prompt, max_tokens=300, temperature=0.0,
+                                                 response_schema=ENGLISH_SENTENCES_SCHEMA)
         
         try:
-            result = json.loads(response)
-            return result.get("english_sentences", [text])  # fallback to original if parsing fails
-        except (json.JSONDecodeError, KeyError):
-            return [text]  # fallback to original text
+            english_sentences = json.loads(response)["english_sentences"]
+        except (json.JSONDecodeError, KeyError, TypeError) as e:
+            raise ValueError(f"Malformed stage direction translation: {response!r}") from e
+        if not isinstance(english_sentences, list):
+            raise ValueError(f"Malformed stage direction translation: {response!r}")
+        return english_sentences
     
     def _translate_speaker_name(self, text: str, metadata: dict = None) -> List[str]:
         """Translate speaker names (usually just return as-is or translate if needed)."""
         # Most speaker names are proper nouns and don't need translation
         # But some might need context (e.g., "CHOR" -> "CHORUS")
-        common_translations = {
-            "CHOR": "CHORUS",
-            "ALLE": "ALL",
-            "STIMME": "VOICE",
-            "SPRECHER": "NARRATOR"
-        }
-        
-        translated = common_translations.get(text.upper(), text)
-        return [translated]
+        return [_SPEAKER_TRANSLATIONS.get(text.upper(), text)]
 
-    def _build_context_prompt(self, metadata: dict, paragraph_context: str, german_sentence: str, sentence_index: int) -> str:
-        """Build contextual prompt with metadata, paragraph context, and target sentence."""
+    def _build_metadata_prefix(self, metadata: dict) -> str:
+        """Build the book metadata block that opens every translation prompt on a page."""
         prompt_parts = []
         
         # Add book metadata context if available
@@ -159,10 +424,15 @@ class LLMService(ABC):
             prompt_parts.append("BOOK CONTEXT: German Literary Text")
             prompt_parts.append("")
         
-        # Add paragraph context
-        prompt_parts.append("PARAGRAPH CONTEXT (for understanding tone and style):")
-        prompt_parts.append(paragraph_context)
-        prompt_parts.append("")
+        return "\n".join(prompt_parts) + "\n"
+    
+    def _build_paragraph_prefix(self, metadata_prefix: str, paragraph_context: str) -> str:
+        """Build the prompt prefix shared by all sentences of a paragraph."""
+        return f"{metadata_prefix}PARAGRAPH CONTEXT (for understanding tone and style):\n{paragraph_context}\n\n"
+
+    def _build_context_prompt(self, paragraph_prefix: str, german_sentence: str, sentence_index: int) -> str:
+        """Build contextual prompt from the paragraph prefix and the target sentence."""
+        prompt_parts = []
         
         # Add target sentence
         prompt_parts.append(f"TARGET SENTENCE TO TRANSLATE (sentence #{sentence_index + 1} in the paragraph):")
@@ -172,53 +442,74 @@ class LLMService(ABC):
         prompt_parts.append("🚨 CRITICAL: If the target sentence contains \\n characters, you MUST preserve them in the EXACT same positions in your English translation.")
         prompt_parts.append("Count the \\n characters in the German text and ensure your English has the same number of \\n characters.")
         
-        return "\n".join(prompt_parts)
+        return paragraph_prefix + "\n".join(prompt_parts)
 
-    def _translate_and_split_with_context(self, german_sentence: str, paragraph_context: str, sentence_index: int, metadata: dict = None, sentence_type: str = "narration") -> List[str]:
+    async def _translate_and_split_with_context(self, german_sentence: str, paragraph_prefix: str, sentence_index: int, sentence_type: str = "narration") -> List[str]:
         """
         Translate a German sentence to one or more English sentences with paragraph context.
         
         Args:
             german_sentence: The specific sentence to translate
-            paragraph_context: The full paragraph for context
+            paragraph_prefix: Prompt prefix with book metadata and the full paragraph for context
             sentence_index: Position of the sentence in the paragraph (0-based)
-            metadata: Complete book metadata (title, author, description) for stylistic context
             sentence_type: Type of sentence (dialogue, narration, etc.)
             
         Returns:
             List of English sentences
         """
-        system_content = (
-            f"🚨 CRITICAL: You are translating German literature ({sentence_type} text) with paragraph context for better quality. "
-            "TRANSLATE ONLY THE SPECIFIED SENTENCE - do not translate the entire paragraph. "
-            "Use the paragraph context to understand tone, style, and meaning, but return only the translation of the target sentence. "
-            "PRESERVE THE PARAGRAPH STRUCTURE - do not merge with sentences from other paragraphs. "
-            "🚨🚨🚨 ABSOLUTE CRITICAL REQUIREMENT: PRESERVE LINE BREAKS 🚨🚨🚨 "
-            "The German text contains \\n characters that represent poetry line breaks. "
-            "YOU MUST PRESERVE EVERY SINGLE \\n CHARACTER IN THE EXACT SAME POSITION. "
-            "COUNT the \\n characters in the German text and ensure your English has THE SAME NUMBER of \\n characters. "
-            "EXAMPLE: German 'Habe nun, ach! Philosophie,\\nJuristerei und Medizin' MUST become English 'I have now, alas! Philosophy,\\nJurisprudence and Medicine' "
-            "DO NOT REMOVE LINE BREAKS. DO NOT MERGE LINES. PRESERVE \\n EXACTLY. "
-            f"For {sentence_type} text, maintain appropriate style and formatting conventions. "
-            "You may split ONE German sentence into multiple English sentences for clarity, "
-            "but maintain the literary style and emotional tone. "
-            "Convert German quotation marks (»«) to English style (\"\"). "
-            "Return ONLY valid JSON of the form: "
-            '{"english_sentences": ["Sentence 1.", "Sentence 2."]}'
-        )
+        system_content = _system_prompt(sentence_type)
         
-        user_content = self._build_context_prompt(metadata, paragraph_context, german_sentence, sentence_index)
+        user_content = self._build_context_prompt(paragraph_prefix, german_sentence, sentence_index)
         
-        response = self._json_translate(system_content, user_content, max_tokens=400, temperature=0.1)
+        response = await self._a_json_translate(system_content, user_content, max_tokens=400, temperature=0.1,
+                                                 response_schema=ENGLISH_SENTENCES_SCHEMA)
         
         try:
             data = json.loads(response)
             english_sentences = data["english_sentences"]
             return english_sentences
-        except Exception:
+        except (json.JSONDecodeError, KeyError, TypeError):
+            # TypeError: valid JSON that isn't an object (e.g. a bare list or string)
             # fallback: treat entire output as one sentence
             return [response.strip()]
     
+    async def _translate_batch(self, items: List[Dict[str, Any]], paragraph_prefix: str) -> Dict[int, List[str]]:
+        """
+        Translate several German sentences in a single request.
+        
+        Args:
+            items: Sentences to translate, each {"id": int, "text": str, "type": str}
+            paragraph_prefix: Prompt prefix with book metadata and the paragraph the sentences come from
+            
+        Returns:
+            Dict mapping item id to its list of English sentences. Items missing from
+            the model's answer are left out so the caller can retry them individually.
+        """
+        system_content = _BATCH_SYSTEM_PROMPT
+        
+        # The prefix is sent once for the whole batch
+        user_content = f"{paragraph_prefix}SENTENCES TO TRANSLATE:\n{json.dumps(items, ensure_ascii=False)}"
+        
+        response = await self._a_json_translate(system_content, user_content, max_tokens=400 * len(items), temperature=0.1,
+                                                 response_schema=BATCH_TRANSLATIONS_SCHEMA)
+        
+        translations = {}
+        try:
+            entries = json.loads(response)["translations"]
+        except (json.JSONDecodeError, KeyError, TypeError):
+            return translations
+        if not isinstance(entries, list):
+            return translations
+        
+        for entry in entries:
+            try:
+                english_sentences = entry["english_sentences"]
+                if isinstance(english_sentences, list):
+                    translations[int(entry["id"])] = english_sentences
+            except (KeyError, TypeError, ValueError):
+                continue
+        return translations
+    
     # Abstract methods that subclasses must implement (API-specific)
     @abstractmethod
     def _simple_translate(self, prompt: str, max_tokens: int = 200, temperature: float = 0.0) -> str:
@@ -236,7 +527,8 @@ class LLMService(ABC):
         pass
     
     @abstractmethod
-    def _json_translate(self, system_prompt: str, user_prompt: str, max_tokens: int = 400, temperature: float = 0.1) -> str:
+    def _json_translate(self, system_prompt: str, user_prompt: str, max_tokens: int = 400, temperature: float = 0.1,
+                        response_schema: Optional[dict] = None) -> str:
         """
         Translation that expects JSON response format.
         
@@ -245,12 +537,28 @@ class LLMService(ABC):
             user_prompt: User content to translate
             max_tokens: Maximum tokens to generate
             temperature: Sampling temperature
+            response_schema: JSON schema the response must follow, for providers that can enforce one
             
         Returns:
             JSON response as string
         """
         pass
     
+    async def _a_simple_translate(self, prompt: str, max_tokens: int = 200, temperature: float = 0.0) -> str:
+        """
+        Async variant of _simple_translate.
+        Runs the blocking call in a worker thread; providers with an async client override this.
+        """
+        return await asyncio.to_thread(self._simple_translate, prompt, max_tokens, temperature)
+    
+    async def _a_json_translate(self, system_prompt: str, user_prompt: str, max_tokens: int = 400, temperature: float = 0.1,
+                                response_schema: Optional[dict] = None) -> str:
+        """
+        Async variant of _json_translate.
+        Runs the blocking call in a worker thread; providers with an async client override this.
+        """
+        return await asyncio.to_thread(self._json_translate, system_prompt, user_prompt, max_tokens, temperature, response_schema)
+    
     @abstractmethod
     def get_provider_name(self) -> str:
         """Get the provider name for this service."""
@@ -300,7 +608,8 @@ When answering questions:
         """
         pass
     
-    def generate_speech(self, text: str, voice: str = "alloy", speed: float = 1.0) -> bytes:
+    def generate_speech(self, text: str, voice: str = "alloy", speed: float = 1.0, stream: bool = False,
+                        response_format: str = "mp3") -> Union[bytes, Iterator[bytes]]:
         """
         Generate speech audio from text using the LLM's TTS capability.
         
@@ -308,9 +617,11 @@ When answering questions:
             text: Text to convert to speech
             voice: Voice to use (alloy, echo, fable, onyx, nova, shimmer)
             speed: Speed of speech (0.25 to 4.0)
+            stream: Return an iterator of audio chunks as they are synthesized
+            response_format: Audio encoding (opus, mp3, aac, flac, wav, pcm)
             
         Returns:
-            Audio data as bytes
+            Audio data as bytes, or an iterator of byte chunks when stream is True
             
         Raises:
             NotImplementedError: If the LLM provider doesn't support TTS
@@ -348,11 +659,11 @@ Format your response clearly with headers and bullet points. Be concise but comp
         return self.chat(prompt)
     
     @abstractmethod
-    def get_provider_info(self) -> Dict[str, Any]:
+    def get_provider_info(self) -> ProviderInfo:
         """
         Get information about this LLM provider.
         
         Returns:
-            Dict containing provider, model, and description
+            ProviderInfo with provider, model, and description
         """
         pass
\ No newline at end of file
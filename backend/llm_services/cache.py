@@ -0,0 +1,160 @@
+"""
+Response caching for LLM services.
+
+This module provides an in-process exact-match cache so that deterministic
+requests (page translations, dictionary lookups) reach the paid provider API
+only once per unique input, and a disk-backed cache for generated speech audio.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from typing import Any, Optional
+from cachetools import LRUCache, TTLCache
+
+
+class LLMCache:
+    """Thread-safe exact-match cache for LLM responses"""
+
+    def __init__(self, maxsize: int = 2048, ttl: float = 86400):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of cached responses
+            ttl: Time-to-live of each entry in seconds
+        """
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(op: str, **fields: Any) -> str:
+        """
+        Build a stable cache key for an operation and its inputs.
+
+        Args:
+            op: Operation name (e.g. 'translate', 'dictionary')
+            **fields: JSON-serializable inputs that determine the response
+
+        Returns:
+            Hex digest identifying the request
+        """
+        payload = json.dumps({"op": op, **fields}, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached response for key, or None on a miss."""
+        with self._lock:
+            return self._cache.get(key)
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a response under key."""
+        with self._lock:
+            self._cache[key] = value
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        with self._lock:
+            self._cache.clear()
+
+
+class TTSCache:
+    """Disk-backed cache for generated speech audio with an in-memory LRU in front"""
+
+    def __init__(self, cache_dir: str, max_bytes: int = 200 * 1024 * 1024, memory_items: int = 256,
+                 extension: str = "mp3"):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding cached audio files (created if missing)
+            max_bytes: Size cap for the directory; least recently used files are evicted beyond it
+            memory_items: Number of audio clips kept in memory
+            extension: File extension of the cached audio format
+        """
+        os.makedirs(cache_dir, exist_ok=True)
+        self.cache_dir = cache_dir
+        self.extension = extension
+        self.max_bytes = max_bytes
+        self._memory = LRUCache(maxsize=memory_items)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(text: str, voice: str, speed: float) -> str:
+        """Build the content hash identifying a clip."""
+        return hashlib.sha256(f"{voice}|{float(speed)}|{text}".encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.{self.extension}")
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return cached audio for key, or None on a miss."""
+        with self._lock:
+            audio_data = self._memory.get(key)
+        if audio_data is not None:
+            return audio_data
+
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                audio_data = f.read()
+        except FileNotFoundError:
+            return None
+
+        # Refresh the access time so eviction stays LRU even on noatime mounts
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        with self._lock:
+            self._memory[key] = audio_data
+        return audio_data
+
+    def set(self, key: str, audio_data: bytes) -> None:
+        """Store audio under key, writing the file atomically."""
+        with self._lock:
+            self._memory[key] = audio_data
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(audio_data)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+        self._evict()
+
+    def _evict(self) -> None:
+        """Remove least recently used files until the directory fits in max_bytes."""
+        files = []
+        total = 0
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                # Files of any audio format count towards the cap; in-flight writes don't
+                if entry.name.endswith(".tmp"):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                files.append((stat.st_atime, stat.st_size, entry.path))
+                total += stat.st_size
+
+        if total <= self.max_bytes:
+            return
+
+        for _, size, path in sorted(files):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+            if total <= self.max_bytes:
+                break
@@ -13,6 +13,7 @@ In production environments, full SSL verification is maintained by default.
 import os
 import ssl
 import urllib3
+from functools import lru_cache
 from typing import Dict, List, Tuple, Optional
 from .base import LLMService
 from .gpt_service import GPTService
@@ -59,10 +60,13 @@ class LLMFactory:
             raise ValueError(f"Unsupported LLM provider: {provider}")
     
     @staticmethod
+    @lru_cache(maxsize=4)
     def test_provider_availability(provider: str) -> bool:
         """
         Test if a provider is available by checking API key configuration.
         No connectivity tests to save costs for now but in the future can be extended.
+        Results are memoised (so the status is printed once per provider); call
+        LLMFactory.test_provider_availability.cache_clear() after reloading the environment.
         
         Args:
             provider: Provider name to test
@@ -5,9 +5,37 @@ This module provides Google Gemini integration for German-English translation
 and chat functionality.
 """
 
-from typing import Dict, Any
+import logging
+import threading
+from typing import Dict, Optional, Tuple
 import google.generativeai as genai
-from .base import LLMService
+from google.api_core import exceptions as google_exceptions
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_random_exponential
+from .base import LLMService, ProviderInfo
+
+# Suppress ALTS warnings for non-GCP environments
+logging.getLogger("google.auth._default").setLevel(logging.ERROR)
+logging.getLogger("google.auth.transport.grpc").setLevel(logging.ERROR)
+
+# genai.configure() is process-global, so remember which key is active and reconfigure
+# only when it changes. Models are reused per (api_key, model) so their gRPC channels
+# stay warm across service instances.
+_CONFIGURED_KEY: Optional[str] = None
+_MODELS: Dict[Tuple[str, str], "genai.GenerativeModel"] = {}
+_models_lock = threading.Lock()
+
+# Quota exhaustion (429) and transient backend failures are retried with jittered
+# exponential backoff, so one rate-limited call doesn't fail a concurrently translated page
+_retry_transient = retry(
+    retry=retry_if_exception_type((
+        google_exceptions.ResourceExhausted,
+        google_exceptions.ServiceUnavailable,
+        google_exceptions.DeadlineExceeded
+    )),
+    wait=wait_random_exponential(multiplier=1, max=30),
+    stop=stop_after_attempt(6),
+    reraise=True
+)
 
 
 class GeminiService(LLMService):
@@ -21,18 +49,22 @@ class GeminiService(LLMService):
             api_key: Google Gemini API key
             model: Model name (e.g., "gemini-1.5-flash", "gemini-1.5-pro")
         """
-        import logging
-        
-        # Suppress ALTS warnings for non-GCP environments
-        logging.getLogger("google.auth._default").setLevel(logging.ERROR)
-        logging.getLogger("google.auth.transport.grpc").setLevel(logging.ERROR)
+        global _CONFIGURED_KEY
+        super().__init__()
         
-        # Configure Gemini API
-        genai.configure(api_key=api_key)
+        with _models_lock:
+            # Configure Gemini API
+            if _CONFIGURED_KEY != api_key:
+                genai.configure(api_key=api_key)
+                _CONFIGURED_KEY = api_key
+            
+            if (api_key, model) not in _MODELS:
+                _MODELS[(api_key, model)] = genai.GenerativeModel(model)
+            self.model = _MODELS[(api_key, model)]
         
         self.model_name = model
-        self.model = genai.GenerativeModel(model)
 
+    @_retry_transient
     def _simple_translate(self, prompt: str, max_tokens: int = 200, temperature: float = 0.0) -> str:
         """Simple translation for short texts like metadata using Gemini API."""
         response = self.model.generate_content(
@@ -44,59 +76,48 @@ class GeminiService(LLMService):
         )
         return response.text.strip()
     
-    def _json_translate(self, system_prompt: str, user_prompt: str, max_tokens: int = 400, temperature: float = 0.1) -> str:
+    @_retry_transient
+    def _json_translate(self, system_prompt: str, user_prompt: str, max_tokens: int = 400, temperature: float = 0.1,
+                        response_schema: Optional[dict] = None) -> str:
         """Translation that expects JSON response format using Gemini API."""
-        # Gemini doesn't have explicit JSON mode, so we combine prompts and add explicit JSON instruction
-        full_prompt = f"{system_prompt}\n\n{user_prompt}\n\nIMPORTANT: Return ONLY valid JSON without any markdown formatting or extra text."
-        
+        # Native JSON mode makes Gemini emit bare JSON (optionally constrained to a schema)
         response = self.model.generate_content(
-            full_prompt,
+            f"{system_prompt}\n\n{user_prompt}",
             generation_config=genai.types.GenerationConfig(
                 max_output_tokens=max_tokens,
                 temperature=temperature,
+                response_mime_type="application/json",
+                response_schema=response_schema,
             )
         )
-        
-        # Post-process the response to extract JSON from markdown code blocks
-        return self._extract_json_from_response(response.text)
+        return response.text
     
-    def _extract_json_from_response(self, response_text: str) -> str:
-        """Extract JSON from Gemini response that may contain markdown code blocks."""
-        import re
-        
-        # First, try to find JSON in markdown code blocks
-        json_pattern = r'```json\s*(\{.*?\})\s*```'
-        matches = re.findall(json_pattern, response_text, re.DOTALL)
-        
-        if matches:
-            # If we found JSON in code blocks, return the first valid one
-            for match in matches:
-                try:
-                    # Validate it's actually valid JSON
-                    import json
-                    json.loads(match)
-                    return match
-                except json.JSONDecodeError:
-                    continue
-        
-        # If no markdown code blocks, try to find raw JSON
-        # Look for content between { and } that might be JSON
-        json_pattern = r'(\{[^{}]*"english_sentences"[^{}]*\})'
-        matches = re.findall(json_pattern, response_text, re.DOTALL)
-        
-        if matches:
-            for match in matches:
-                try:
-                    # Validate it's actually valid JSON
-                    import json
-                    json.loads(match)
-                    return match
-                except json.JSONDecodeError:
-                    continue
-        
-        # If we still can't find valid JSON, return the original response
-        # The calling code will handle the parsing error
-        return response_text.strip()
+    @_retry_transient
+    async def _a_simple_translate(self, prompt: str, max_tokens: int = 200, temperature: float = 0.0) -> str:
+        """Async simple translation using the Gemini async API."""
+        response = await self.model.generate_content_async(
+            prompt,
+            generation_config=genai.types.GenerationConfig(
+                max_output_tokens=max_tokens,
+                temperature=temperature,
+            )
+        )
+        return response.text.strip()
+    
+    @_retry_transient
+    async def _a_json_translate(self, system_prompt: str, user_prompt: str, max_tokens: int = 400, temperature: float = 0.1,
+                                response_schema: Optional[dict] = None) -> str:
+        """Async JSON translation using the Gemini async API."""
+        response = await self.model.generate_content_async(
+            f"{system_prompt}\n\n{user_prompt}",
+            generation_config=genai.types.GenerationConfig(
+                max_output_tokens=max_tokens,
+                temperature=temperature,
+                response_mime_type="application/json",
+                response_schema=response_schema,
+            )
+        )
+        return response.text
     
     def get_provider_name(self) -> str:
         """Get the provider name for this service."""
@@ -121,10 +142,10 @@ class GeminiService(LLMService):
         except Exception as e:
             raise Exception(f"Gemini chat failed: {str(e)}")
     
-    def get_provider_info(self) -> Dict[str, Any]:
+    def get_provider_info(self) -> ProviderInfo:
         """Get Gemini provider information"""
-        return {
-            "provider": "google",
-            "model": self.model_name,
-            "description": f"Google {self.model_name}"
-        }
\ No newline at end of file
+        return ProviderInfo(
+            provider="google",
+            model=self.model_name,
+            description=f"Google {self.model_name}"
+        )
\ No newline at end of file
@@ -1,20 +1,94 @@
-from typing import Dict, Any
+from typing import Dict, Iterator, Optional, Union
+import threading
+import httpx
 import openai
-from .base import LLMService
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_random_exponential
+from .base import BATCH_TRANSLATIONS_SCHEMA, ENGLISH_SENTENCES_SCHEMA, LLMService, ProviderInfo
+
+# Connection pools shared by every GPTService, so services created for provider probing
+# or switching reuse warm keep-alive connections instead of paying a new TCP+TLS setup.
+# The async pool is only ever used from the shared LLM event loop.
+_HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32, keepalive_expiry=60)
+_HTTP_CLIENT = httpx.Client(trust_env=False, timeout=30.0, limits=_HTTP_LIMITS)
+_ASYNC_HTTP_CLIENT = httpx.AsyncClient(trust_env=False, timeout=30.0, limits=_HTTP_LIMITS)
+_CLIENTS: Dict[str, openai.OpenAI] = {}
+_TRANSLATE_CLIENTS: Dict[str, openai.OpenAI] = {}
+_ASYNC_CLIENTS: Dict[str, openai.AsyncOpenAI] = {}
+_clients_lock = threading.Lock()
+
+# Rate limits, server errors and transient network failures in translation calls are retried
+# with jittered exponential backoff, so one 429 during concurrent page translation doesn't fail
+# the whole page. The SDK's own retries are disabled only on the clients these calls use
+# (_TRANSLATE_CLIENTS and _ASYNC_CLIENTS) to avoid stacking the two; chat and TTS keep them.
+_retry_transient = retry(
+    retry=retry_if_exception_type((
+        openai.RateLimitError,
+        openai.InternalServerError,
+        openai.APITimeoutError,
+        openai.APIConnectionError
+    )),
+    wait=wait_random_exponential(multiplier=1, max=30),
+    stop=stop_after_attempt(6),
+    reraise=True
+)
+
+
+def _strict_schema(schema: dict) -> dict:
+    """Copy a JSON schema, closing every object as OpenAI strict mode requires."""
+    strict = {key: value for key, value in schema.items() if key not in ("properties", "items")}
+    if "properties" in schema:
+        strict["properties"] = {name: _strict_schema(prop) for name, prop in schema["properties"].items()}
+        strict["additionalProperties"] = False
+    if "items" in schema:
+        strict["items"] = _strict_schema(schema["items"])
+    return strict
+
+
+# Structured Outputs formats for the shared response schemas, built once
+_ENGLISH_SENTENCES_SCHEMA = {
+    "name": "EnglishSentences",
+    "schema": _strict_schema(ENGLISH_SENTENCES_SCHEMA),
+    "strict": True
+}
+_BATCH_TRANSLATIONS_SCHEMA = {
+    "name": "BatchTranslations",
+    "schema": _strict_schema(BATCH_TRANSLATIONS_SCHEMA),
+    "strict": True
+}
+
+
+def _response_format(response_schema: Optional[dict]) -> dict:
+    """Pick the response_format for a JSON request."""
+    if response_schema is ENGLISH_SENTENCES_SCHEMA:
+        return {"type": "json_schema", "json_schema": _ENGLISH_SENTENCES_SCHEMA}
+    if response_schema is BATCH_TRANSLATIONS_SCHEMA:
+        return {"type": "json_schema", "json_schema": _BATCH_TRANSLATIONS_SCHEMA}
+    if response_schema is not None:
+        return {"type": "json_schema", "json_schema": {"name": "Response", "schema": _strict_schema(response_schema), "strict": True}}
+    return {"type": "json_object"}  # OpenAI-specific JSON mode
 
 
 class GPTService(LLMService):
     """OpenAI GPT service implementation with API-specific code only"""
     
     def __init__(self, api_key: str, model: str = "gpt-4o-mini"):
-        import httpx
-        http_client = httpx.Client(trust_env=False, timeout=30.0)
-        self.client = openai.OpenAI(api_key=api_key, http_client=http_client)
+        super().__init__()
+        with _clients_lock:
+            if api_key not in _CLIENTS:
+                _CLIENTS[api_key] = openai.OpenAI(api_key=api_key, http_client=_HTTP_CLIENT)
+                _TRANSLATE_CLIENTS[api_key] = _CLIENTS[api_key].with_options(max_retries=0)
+                # Async client for concurrent sentence translation (used on the shared LLM event loop)
+                _ASYNC_CLIENTS[api_key] = openai.AsyncOpenAI(api_key=api_key, http_client=_ASYNC_HTTP_CLIENT, max_retries=0)
+            self.client = _CLIENTS[api_key]
+            # Retried by _retry_transient instead of the SDK
+            self.translate_client = _TRANSLATE_CLIENTS[api_key]
+            self.async_client = _ASYNC_CLIENTS[api_key]
         self.model = model
 
+    @_retry_transient
     def _simple_translate(self, prompt: str, max_tokens: int = 200, temperature: float = 0.0) -> str:
         """Simple translation for short texts like metadata using OpenAI API."""
-        resp = self.client.chat.completions.create(
+        resp = self.translate_client.chat.completions.create(
             model=self.model,
             messages=[
                 {"role": "system", "content": "Translate the following from German to English. Return only the translation text."},
@@ -25,9 +99,11 @@ class GPTService(LLMService):
         )
         return resp.choices[0].message.content.strip()
     
-    def _json_translate(self, system_prompt: str, user_prompt: str, max_tokens: int = 400, temperature: float = 0.1) -> str:
+    @_retry_transient
+    def _json_translate(self, system_prompt: str, user_prompt: str, max_tokens: int = 400, temperature: float = 0.1,
+                        response_schema: Optional[dict] = None) -> str:
         """Translation that expects JSON response format using OpenAI API."""
-        resp = self.client.chat.completions.create(
+        resp = self.translate_client.chat.completions.create(
             model=self.model,
             messages=[
                 {"role": "system", "content": system_prompt},
@@ -35,9 +111,41 @@ class GPTService(LLMService):
             ],
             temperature=temperature,
             max_tokens=max_tokens,
-            response_format={"type": "json_object"}  # OpenAI-specific JSON mode
+            response_format=_response_format(response_schema)
+        )
+        # content is None when the model refuses; callers fall back on unparseable output
+        return resp.choices[0].message.content or ""
+    
+    @_retry_transient
+    async def _a_simple_translate(self, prompt: str, max_tokens: int = 200, temperature: float = 0.0) -> str:
+        """Async simple translation using the OpenAI async client."""
+        resp = await self.async_client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": "Translate the following from German to English. Return only the translation text."},
+                {"role": "user", "content": prompt}
+            ],
+            temperature=temperature,
+            max_tokens=max_tokens,
         )
-        return resp.choices[0].message.content
+        return resp.choices[0].message.content.strip()
+    
+    @_retry_transient
+    async def _a_json_translate(self, system_prompt: str, user_prompt: str, max_tokens: int = 400, temperature: float = 0.1,
+                                response_schema: Optional[dict] = None) -> str:
+        """Async JSON translation using the OpenAI async client."""
+        resp = await self.async_client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
+            ],
+            temperature=temperature,
+            max_tokens=max_tokens,
+            response_format=_response_format(response_schema)
+        )
+        # content is None when the model refuses; callers fall back on unparseable output
+        return resp.choices[0].message.content or ""
     
     def get_provider_name(self) -> str:
         """Get the provider name for this service."""
@@ -61,14 +169,19 @@ class GPTService(LLMService):
         except Exception as e:
             raise Exception(f"GPT chat failed: {str(e)}")
     
-    def generate_speech(self, text: str, voice: str = "alloy", speed: float = 1.0) -> bytes:
+    def generate_speech(self, text: str, voice: str = "alloy", speed: float = 1.0, stream: bool = False,
+                        response_format: str = "mp3") -> Union[bytes, Iterator[bytes]]:
         """Generate speech audio from text using OpenAI's TTS."""
+        if stream:
+            return self._stream_speech(text, voice, speed, response_format)
+        
         try:
             response = self.client.audio.speech.create(
                 model="tts-1",  # Use tts-1 model (faster, good quality)
                 voice=voice,
                 input=text,
-                speed=speed
+                speed=speed,
+                response_format=response_format
             )
             
             # Return the audio content as bytes
@@ -77,10 +190,24 @@ class GPTService(LLMService):
         except Exception as e:
             raise Exception(f"OpenAI TTS failed: {str(e)}")
     
-    def get_provider_info(self) -> Dict[str, Any]:
+    def _stream_speech(self, text: str, voice: str, speed: float, response_format: str) -> Iterator[bytes]:
+        """Yield OpenAI TTS audio in chunks while it is being synthesized."""
+        try:
+            with self.client.audio.speech.with_streaming_response.create(
+                model="tts-1",
+                voice=voice,
+                input=text,
+                speed=speed,
+                response_format=response_format
+            ) as response:
+                yield from response.iter_bytes(chunk_size=4096)
+        except Exception as e:
+            raise Exception(f"OpenAI TTS failed: {str(e)}")
+    
+    def get_provider_info(self) -> ProviderInfo:
         """Get GPT provider information"""
-        return {
-            "provider": "openai",
-            "model": self.model,
-            "description": f"OpenAI {self.model}"
-        }
+        return ProviderInfo(
+            provider="openai",
+            model=self.model,
+            description=f"OpenAI {self.model}"
+        )
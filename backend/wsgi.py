@@ -0,0 +1,12 @@
+"""
+WSGI entry point for production servers.
+
+Run with threaded workers, since most requests wait on LLM/TTS network calls:
+
+    gunicorn -k gthread -w 1 --threads 16 -b 0.0.0.0:5001 wsgi:app
+
+A single worker process keeps the provider selection (/api/llm/provider) and
+the in-memory caches consistent across requests.
+"""
+
+from app import app  # noqa: F401
@@ -114,14 +114,8 @@ export class EnhancedTTSService {
       throw new Error(errorData.error || 'TTS request failed');
     }
 
-    const data = await response.json();
-    
-    if (!data.success || !data.audio) {
-      throw new Error(data.error || 'Invalid TTS response');
-    }
-
-    // Convert base64 to audio blob
-    return this.base64ToBlob(data.audio, 'audio/mpeg');
+    // Backend returns raw audio bytes (MP3 by default)
+    return response.blob();
   }
 
   /**
@@ -131,21 +125,6 @@ export class EnhancedTTSService {
     return gptTtsService.playAudioBlob(audioBlob);
   }
 
-  /**
-   * Convert base64 to blob
-   */
-  private base64ToBlob(base64: string, mimeType: string): Blob {
-    const byteCharacters = atob(base64);
-    const byteNumbers = new Array(byteCharacters.length);
-    
-    for (let i = 0; i < byteCharacters.length; i++) {
-      byteNumbers[i] = byteCharacters.charCodeAt(i);
-    }
-    
-    const byteArray = new Uint8Array(byteNumbers);
-    return new Blob([byteArray], { type: mimeType });
-  }
-
   public stop(): void {
     // Stop both services to be safe
     if (this.currentProvider === 'gpt' || this.currentProvider === null) {
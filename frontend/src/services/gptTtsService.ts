@@ -5,13 +5,6 @@ export interface TTSOptions {
   speed?: number; // 0.25 to 4.0
 }
 
-interface TTSResponse {
-  success?: boolean;
-  audio?: string; // base64 encoded audio
-  format?: string;
-  error?: string;
-}
-
 export class GPTTTSService {
   private baseUrl: string;
   private currentAudio: HTMLAudioElement | null = null;
@@ -50,14 +43,8 @@ export class GPTTTSService {
           throw new Error(errorData.error || 'TTS request failed');
         }
 
-        const data: TTSResponse = await response.json();
-        
-        if (!data.success || !data.audio) {
-          throw new Error(data.error || 'Invalid TTS response');
-        }
-
-        // Convert base64 to audio blob
-        const audioBlob = this.base64ToBlob(data.audio, 'audio/mpeg');
+        // Backend returns raw audio bytes (MP3 by default)
+        const audioBlob = await response.blob();
 
         // Create and play audio element
         const audioUrl = URL.createObjectURL(audioBlob);
@@ -99,18 +86,6 @@ export class GPTTTSService {
     }
   }
 
-  private base64ToBlob(base64: string, mimeType: string): Blob {
-    const byteCharacters = atob(base64);
-    const byteNumbers = new Array(byteCharacters.length);
-    
-    for (let i = 0; i < byteCharacters.length; i++) {
-      byteNumbers[i] = byteCharacters.charCodeAt(i);
-    }
-    
-    const byteArray = new Uint8Array(byteNumbers);
-    return new Blob([byteArray], { type: mimeType });
-  }
-
   public stop(): void {
     if (this.currentAudio) {
       this.currentAudio.pause();